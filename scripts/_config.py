@@ -0,0 +1,38 @@
+"""
+Shared configuration for the arXiv scripts: .env loading and credentials.
+"""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+
+
+# The repo-root .env first, then one in the working directory; load_dotenv never
+# overrides a variable that is already set, so earlier files win
+ENV_PATHS = (Path(__file__).parent.parent / ".env", Path.cwd() / ".env")
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the .env files into the environment (only once per process)."""
+    for env_path in ENV_PATHS:
+        if env_path.exists():
+            load_dotenv(env_path)
+
+
+@lru_cache(maxsize=1)
+def credentials() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the arXiv (username, password) from the environment.
+
+    ARXIV_USER / ARXIV_PASS take precedence over ARXIV_USERNAME / ARXIV_PASSWORD.
+    Either value is None if it isn't set.
+    """
+    load_env()
+    username = os.getenv("ARXIV_USER") or os.getenv("ARXIV_USERNAME")
+    password = os.getenv("ARXIV_PASS") or os.getenv("ARXIV_PASSWORD")
+    return username, password
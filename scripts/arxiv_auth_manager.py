@@ -7,10 +7,13 @@ Handles login once and saves the authentication state for reuse.
 from __future__ import annotations
 
 import asyncio
-import os
+import re
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+
+import orjson
 
 try:
     from playwright.async_api import async_playwright, Browser, BrowserContext, Page
@@ -19,11 +22,12 @@ except ImportError:
     print("Install with: uv sync && uv run playwright install chromium", file=sys.stderr)
     sys.exit(1)
 
-from dotenv import load_dotenv
+from _config import credentials
 
 
 ARXIV_LOGIN_URL = "https://arxiv.org/login"
 DEFAULT_AUTH_STATE_PATH = Path.home() / ".arxiv_reviewer_cache" / "arxiv_auth_state.json"
+SESSION_COOKIE_PREFIXES = ("tapir_session", "arxiv_session")
 
 
 class ArxivAuthManager:
@@ -43,13 +47,9 @@ class ArxivAuthManager:
             password: arXiv password (if None, loads from env)
             auth_state_path: Path to save/load auth state
         """
-        # Load .env if it exists
-        env_path = Path.cwd() / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
-        
-        self.username = username or os.getenv("ARXIV_USER") or os.getenv("ARXIV_USERNAME")
-        self.password = password or os.getenv("ARXIV_PASS") or os.getenv("ARXIV_PASSWORD")
+        env_username, env_password = credentials()
+        self.username = username or env_username
+        self.password = password or env_password
         
         if not self.username or not self.password:
             raise ValueError(
@@ -59,11 +59,27 @@ class ArxivAuthManager:
         
         self.auth_state_path = auth_state_path or DEFAULT_AUTH_STATE_PATH
         self.auth_state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._storage_state: Optional[Dict[str, Any]] = None
     
     def has_saved_auth(self) -> bool:
         """Check if we have a saved authentication state."""
         return self.auth_state_path.exists()
     
+    def state_age_seconds(self) -> float:
+        """Seconds since the saved authentication state was written."""
+        return time.time() - self.auth_state_path.stat().st_mtime
+    
+    def storage_state(self) -> Dict[str, Any]:
+        """
+        Return the saved Playwright storage state as a dict.
+        
+        The file is read once and kept in memory, so every context and HTTP
+        client created afterwards reuses the parsed state.
+        """
+        if self._storage_state is None:
+            self._storage_state = orjson.loads(self.auth_state_path.read_bytes())
+        return self._storage_state
+    
     async def login_and_save_state(self, browser: Browser) -> bool:
         """
         Perform login and save the authentication state.
@@ -77,44 +93,39 @@ class ArxivAuthManager:
         page = await context.new_page()
         
         try:
-            await page.goto(ARXIV_LOGIN_URL, wait_until="networkidle")
+            await page.goto(ARXIV_LOGIN_URL, wait_until="domcontentloaded")
             await asyncio.sleep(1)
             
-            # Fill in credentials
-            try:
-                await page.fill('input[name="username"]', self.username, timeout=5000)
-            except:
-                try:
-                    await page.fill('input[id="username"]', self.username, timeout=5000)
-                except:
-                    await page.fill('input[type="text"]', self.username, timeout=5000)
-            
-            try:
-                await page.fill('input[name="password"]', self.password, timeout=5000)
-            except:
-                try:
-                    await page.fill('input[id="password"]', self.password, timeout=5000)
-                except:
-                    await page.fill('input[type="password"]', self.password, timeout=5000)
+            # Fill in credentials - each selector list resolves in a single query, so a
+            # missing variant doesn't cost a timeout before the next one is tried
+            login_form = 'form:has(input[type="password"])'
+            await page.locator(
+                f'input[name="username"], input#username, {login_form} input[type="text"]'
+            ).first.fill(self.username, timeout=5000)
+            await page.locator(
+                'input[name="password"], input#password, input[type="password"]'
+            ).first.fill(self.password, timeout=5000)
             
             print("  Filled in credentials, submitting...", file=sys.stderr)
             
-            # Submit the form
-            submit_clicked = False
-            for selector in ['button[type="submit"]', 'input[type="submit"]', 'text=/sign in|log in/i']:
-                try:
-                    await page.click(selector, timeout=5000)
-                    submit_clicked = True
-                    break
-                except:
-                    continue
-            
-            if not submit_clicked:
+            # Submit the form - every alternative is scoped to the login form, since
+            # .first picks in document order and a "Log in" heading may come earlier
+            submit = page.locator(
+                f'{login_form} button[type="submit"], {login_form} input[type="submit"]'
+            ).or_(page.locator(login_form).get_by_text(re.compile(r"sign in|log in", re.IGNORECASE)))
+            try:
+                await submit.first.click(timeout=5000)
+            except:
                 await page.press('input[type="password"]', 'Enter')
             
-            # Wait for navigation
+            # Wait for the redirect away from the login page rather than network idle
             print("  Waiting for login response...", file=sys.stderr)
-            await page.wait_for_load_state("networkidle", timeout=30000)
+            try:
+                await page.wait_for_url(
+                    lambda url: "login" not in url, wait_until="domcontentloaded", timeout=15000
+                )
+            except:
+                pass
             
             # Verify login success
             current_url = page.url
@@ -124,17 +135,13 @@ class ArxivAuthManager:
                 await context.close()
                 return False
             
-            # Try to verify we're logged in
-            try:
-                await page.wait_for_selector('text=/logout|log out/i', timeout=5000)
-            except:
-                if "login" in current_url:
-                    print("✗ Login failed - still on login page", file=sys.stderr)
-                    await context.close()
-                    return False
+            if not await self._is_logged_in(page):
+                print("✗ Login failed - still on login page", file=sys.stderr)
+                await context.close()
+                return False
             
-            # Save the authentication state
-            await context.storage_state(path=str(self.auth_state_path))
+            # Save the authentication state, keeping the returned dict in memory
+            self._storage_state = await context.storage_state(path=str(self.auth_state_path))
             print(f"✓ Login successful, state saved to {self.auth_state_path}", file=sys.stderr)
             
             await context.close()
@@ -149,16 +156,19 @@ class ArxivAuthManager:
         self,
         browser: Browser,
         force_reauth: bool = False,
+        java_script_enabled: bool = True,
     ) -> Optional[BrowserContext]:
         """
         Create a browser context with arXiv authentication.
         
         If saved auth state exists and force_reauth is False, loads it.
-        Otherwise, performs login and saves the state.
+        Otherwise, performs login and saves the state. Login always runs in its
+        own JS-enabled context, regardless of java_script_enabled.
         
         Args:
             browser: Playwright browser instance
             force_reauth: If True, force a new login even if state exists
+            java_script_enabled: Whether the returned context runs page JavaScript
             
         Returns:
             Authenticated BrowserContext or None if login failed
@@ -173,13 +183,17 @@ class ArxivAuthManager:
         
         # Create context with saved state
         try:
-            context = await browser.new_context(storage_state=str(self.auth_state_path))
+            context = await browser.new_context(
+                storage_state=self.storage_state(),
+                java_script_enabled=java_script_enabled,
+            )
             return context
         except Exception as e:
             print(f"✗ Error loading auth state: {e}", file=sys.stderr)
             print("  Attempting fresh login...", file=sys.stderr)
             
             # Delete invalid state and retry
+            self._storage_state = None
             if self.auth_state_path.exists():
                 self.auth_state_path.unlink()
             
@@ -187,7 +201,30 @@ class ArxivAuthManager:
             if not success:
                 return None
             
-            return await browser.new_context(storage_state=str(self.auth_state_path))
+            return await browser.new_context(
+                storage_state=self.storage_state(),
+                java_script_enabled=java_script_enabled,
+            )
+    
+    async def _is_logged_in(self, page: Page) -> bool:
+        """
+        Check that the page is off the login page and holds an arXiv session cookie.
+        
+        Falls back to a quick structural check for a logout link in case the
+        session cookie names change.
+        """
+        if "login" in page.url:
+            return False
+        
+        cookies = await page.context.cookies("https://arxiv.org")
+        if any(c["name"].startswith(SESSION_COOKIE_PREFIXES) for c in cookies):
+            return True
+        
+        try:
+            await page.locator('a[href*="/logout"]').first.wait_for(timeout=2000)
+            return True
+        except:
+            return False
     
     async def verify_auth(self, context: BrowserContext) -> bool:
         """
@@ -197,21 +234,12 @@ class ArxivAuthManager:
         """
         page = await context.new_page()
         try:
-            # Visit a page that requires authentication
-            await page.goto("https://arxiv.org/user/", timeout=10000)
-            
-            # Check if we're still logged in
-            try:
-                await page.wait_for_selector('text=/logout|log out/i', timeout=5000)
-                await page.close()
-                return True
-            except:
-                # If we're redirected to login, auth expired
-                if "login" in page.url:
-                    await page.close()
-                    return False
-                await page.close()
-                return True
+            # Visit a page that requires authentication; if we're redirected to
+            # login, auth expired
+            await page.goto("https://arxiv.org/user/", wait_until="domcontentloaded", timeout=10000)
+            is_valid = await self._is_logged_in(page)
+            await page.close()
+            return is_valid
         except Exception as e:
             print(f"  Warning: Could not verify auth: {e}", file=sys.stderr)
             await page.close()
@@ -219,6 +247,7 @@ class ArxivAuthManager:
     
     def clear_auth_state(self):
         """Remove saved authentication state."""
+        self._storage_state = None
         if self.auth_state_path.exists():
             self.auth_state_path.unlink()
             print(f"✓ Cleared auth state from {self.auth_state_path}", file=sys.stderr)
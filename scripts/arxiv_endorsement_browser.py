@@ -11,17 +11,22 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
 from datetime import datetime, timezone
-import json
 import os
+import re
 import sys
+import tempfile
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from dotenv import load_dotenv
+import httpx
+import orjson
+from selectolax.parser import HTMLParser
 
 try:
-    from playwright.async_api import async_playwright, Page, Browser
+    from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Route
 except ImportError:
     print("Error: Playwright is not installed.", file=sys.stderr)
     print("Install with: uv sync && uv run playwright install chromium", file=sys.stderr)
@@ -31,19 +36,43 @@ except ImportError:
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
+from _config import credentials
 from arxiv_auth_manager import ArxivAuthManager
+from rate_limiter import DEFAULT_JITTER, RateLimiter, get_with_backoff
 
-# Load .env
-env_path = script_dir.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+_UTC = timezone.utc
 
 DEFAULT_DELAY_SECONDS = 15
+DEFAULT_CONCURRENCY = 4
+DEFAULT_VERIFY_AFTER_SECONDS = 60 * 60
+# Close and reopen the browser context after this many pages to bound memory growth
+DEFAULT_RECYCLE_EVERY = 50
+ENDORSERS_URL = "https://arxiv.org/auth/show-endorsers/{arxiv_id}"
+DEFAULT_DAEMON_SOCKET_PATH = Path.home() / ".arxiv_reviewer_cache" / "daemon.sock"
 
+# New-style (2307.09288v2) and old-style (hep-th/9901001, math.GT/0309136) arXiv IDs
+ARXIV_ID_RE = re.compile(r'\d{4}\.\d{4,5}(v\d+)?|[a-z-]+(\.[A-Z]{2})?/\d{7}(v\d+)?')
+
+# Endorser lists change over days; pages without endorsers info are rechecked sooner
+ENDORSERS_CACHE_DIR = Path.home() / ".arxiv_reviewer_cache" / "endorsers"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+UNAVAILABLE_CACHE_TTL_SECONDS = 60 * 60
+# Not found (cached) or login page (session expired, never cached)
+UNAVAILABLE_ERROR_PREFIX = "Endorsers page not accessible"
+# Throttling, server errors and other failed responses - never cached
+FETCH_FAILED_ERROR_PREFIX = "Endorsers page fetch failed"
+
+# Nothing but the HTML document matters for scraping the endorsers table
+BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media", "other"}
+BLOCKED_URL_PARTS = ("google-analytics", "doubleclick")
+
+# Leaner Chromium for scraping: no GPU process, no /dev/shm size limits, no extensions
+CHROMIUM_ARGS = ["--disable-gpu", "--disable-dev-shm-usage", "--disable-extensions"]
 
 async def check_paper_endorsements(
     page: Page,
     arxiv_id: str,
+    debug_html: bool = False,
 ) -> Optional[Dict[str, object]]:
     """
     Navigate directly to the endorsers page and extract eligible endorsers.
@@ -52,30 +81,32 @@ async def check_paper_endorsements(
         - arxiv_id: str
         - endorsers: List[str]  (authors who can endorse)
         - check_timestamp: str
-        - raw_html: str (for debugging)
+        - raw_html: str (page HTML if debug_html, else "")
         - error: str (optional, if there was an error)
     """
     # Navigate directly to the endorsers page (requires authentication)
-    endorsers_url = f"https://arxiv.org/auth/show-endorsers/{arxiv_id}"
+    endorsers_url = ENDORSERS_URL.format(arxiv_id=arxiv_id)
+    check_timestamp = datetime.now(_UTC).isoformat(timespec="seconds")
     print(f"  Checking {arxiv_id}...", file=sys.stderr)
     
     try:
-        await page.goto(endorsers_url, wait_until="networkidle")
+        # The endorsers page is static HTML - no need to wait for network idle
+        response = await page.goto(endorsers_url, wait_until="domcontentloaded")
         
         # Check if we got a 404, error, or login page
         page_title = await page.title()
-        if any(x in page_title.lower() for x in ["not found", "error", "log in"]):
+        error_prefix = _unavailable_error_prefix(response.status if response else 200, page_title)
+        if error_prefix:
             print(f"    Endorsers page not available: {page_title}", file=sys.stderr)
             return {
                 "arxiv_id": arxiv_id,
                 "endorsers": [],
-                "check_timestamp": datetime.now(timezone.utc).isoformat(),
-                "raw_html": await page.content(),
-                "error": f"Endorsers page not accessible: {page_title}",
+                "check_timestamp": check_timestamp,
+                "raw_html": await page.content() if debug_html else "",
+                "error": f"{error_prefix}: {page_title}",
             }
         
-        # Extract endorsement information
-        page_content = await page.content()
+        await page.wait_for_selector("table", timeout=10000)
         
         # Parse the endorsers page
         endorsers = await extract_endorsers_from_page(page)
@@ -85,8 +116,8 @@ async def check_paper_endorsements(
         return {
             "arxiv_id": arxiv_id,
             "endorsers": endorsers,
-            "check_timestamp": datetime.now(timezone.utc).isoformat(),
-            "raw_html": page_content,
+            "check_timestamp": check_timestamp,
+            "raw_html": await page.content() if debug_html else "",
         }
     
     except Exception as e:
@@ -94,7 +125,7 @@ async def check_paper_endorsements(
         return {
             "arxiv_id": arxiv_id,
             "endorsers": [],
-            "check_timestamp": datetime.now(timezone.utc).isoformat(),
+            "check_timestamp": check_timestamp,
             "raw_html": "",
             "error": str(e),
         }
@@ -102,30 +133,369 @@ async def check_paper_endorsements(
 
 async def extract_endorsers_from_page(page: Page) -> List[str]:
     """Extract only the endorsers from the endorsers page."""
-    endorsers = []
-    
     try:
-        # Extract endorsers from the table rows
-        # Look for rows containing "Can endorse for"
-        table_rows = await page.query_selector_all('table tr')
-        for row in table_rows:
-            row_text = await row.inner_text()
-            
-            # Check if this row indicates an endorser
-            if 'can endorse' in row_text.lower():
-                # Extract the author name (in bold, followed by colon)
-                bold_elements = await row.query_selector_all('b')
-                for bold in bold_elements:
-                    author_name = (await bold.inner_text()).strip().rstrip(':')
-                    if author_name and author_name not in endorsers:
-                        endorsers.append(author_name)
+        # Rows containing "Can endorse for" list the author name in bold, followed by a
+        # colon. Parse them in one evaluate call instead of a round trip per element.
+        return await page.evaluate(
+            """() => {
+                const endorsers = new Set();
+                for (const row of document.querySelectorAll('table tr')) {
+                    if (!row.innerText.toLowerCase().includes('can endorse')) continue;
+                    for (const bold of row.querySelectorAll('b')) {
+                        const name = bold.innerText.trim().replace(/:+$/, '');
+                        if (name) endorsers.add(name);
+                    }
+                }
+                return [...endorsers];
+            }"""
+        )
     
     except Exception as e:
         print(f"    Warning: Error extracting endorsers: {e}", file=sys.stderr)
+        return []
+
+
+async def block_nonessential_requests(route: Route) -> None:
+    """Abort images, CSS, fonts, media and analytics; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def create_scraping_context(
+    auth_manager: ArxivAuthManager,
+    browser: Browser,
+    force_reauth: bool = False,
+) -> Optional[BrowserContext]:
+    """Create an authenticated, JS-disabled context that only loads HTML documents."""
+    context = await auth_manager.create_authenticated_context(
+        browser, force_reauth=force_reauth, java_script_enabled=False
+    )
+    if context:
+        await context.route("**/*", block_nonessential_requests)
+    return context
+
+
+async def open_verified_context(
+    auth_manager: ArxivAuthManager,
+    browser: Browser,
+    verify_after_seconds: int = DEFAULT_VERIFY_AFTER_SECONDS,
+) -> Optional[BrowserContext]:
+    """
+    Open a scraping context for the saved session, logging in again if it expired.
+    
+    A session saved within verify_after_seconds is trusted without a verification
+    request. Returns None if authentication fails.
+    """
+    context = await create_scraping_context(auth_manager, browser)
+    if not context:
+        print("✗ Failed to authenticate", file=sys.stderr)
+        return None
+    
+    # Trust a recently saved session; otherwise verify it is still valid
+    state_age = auth_manager.state_age_seconds()
+    if state_age <= verify_after_seconds:
+        print(f"✓ Session saved {state_age / 60:.0f} min ago, skipping verification",
+              file=sys.stderr)
+        return context
+    
+    if await auth_manager.verify_auth(context):
+        return context
+    
+    print("✗ Authentication expired, trying fresh login...", file=sys.stderr)
+    await context.close()
+    context = await create_scraping_context(auth_manager, browser, force_reauth=True)
+    if not context:
+        print("✗ Re-authentication failed", file=sys.stderr)
+    return context
+
+
+class RecyclingContext:
+    """Hands out pages from a scraping context, replacing the context periodically.
+    
+    Long-lived contexts leak memory, so once `recycle_every` pages have been opened
+    the context is closed and recreated from the saved auth state. From then on
+    new_page hands out nothing until every page already open has been released,
+    so the old context drains even under steady concurrent use.
+    """
+    
+    def __init__(
+        self,
+        auth_manager: ArxivAuthManager,
+        browser: Browser,
+        context: BrowserContext,
+        recycle_every: int = DEFAULT_RECYCLE_EVERY,
+    ):
+        self.auth_manager = auth_manager
+        self.browser = browser
+        self.context = context
+        self.recycle_every = recycle_every
+        # Notified whenever a page is released or the context is replaced
+        self._changed = asyncio.Condition()
+        self._pages_opened = 0
+        self._open_pages = 0
+    
+    async def new_page(self) -> Page:
+        """Open a page, recycling the context first if it is due.
+        
+        Once recycling is due, waits for the open pages to be released first.
+        """
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: self._pages_opened < self.recycle_every or not self._open_pages
+            )
+            if self._pages_opened >= self.recycle_every:
+                print(f"  Recycling browser context after {self._pages_opened} pages",
+                      file=sys.stderr)
+                await self.context.close()
+                context = await create_scraping_context(self.auth_manager, self.browser)
+                if not context:
+                    raise RuntimeError("Could not recreate authenticated browser context")
+                self.context = context
+                self._pages_opened = 0
+                self._changed.notify_all()
+            
+            page = await self.context.new_page()
+            self._pages_opened += 1
+            self._open_pages += 1
+        return page
+    
+    async def reauthenticate(self) -> None:
+        """Log in again and swap in a fresh context (the saved session expired).
+        
+        Pages still open on the old context fail and are reported by check_paper.
+        """
+        async with self._changed:
+            context = await create_scraping_context(
+                self.auth_manager, self.browser, force_reauth=True
+            )
+            if not context:
+                raise RuntimeError("Could not log in to arXiv again")
+            await self.context.close()
+            self.context = context
+            self._pages_opened = 0
+            self._changed.notify_all()
+    
+    async def release(self, page: Page) -> None:
+        """Close a page obtained from new_page."""
+        try:
+            await page.close()
+        finally:
+            async with self._changed:
+                self._open_pages -= 1
+                self._changed.notify_all()
+    
+    async def close(self) -> None:
+        await self.context.close()
+
+
+def _unavailable_error_prefix(status_code: int, page_title: str) -> Optional[str]:
+    """Classify an endorsers page response that has no endorsers table.
+    
+    Returns UNAVAILABLE_ERROR_PREFIX for a missing paper or the login page,
+    FETCH_FAILED_ERROR_PREFIX for any other failure, or None if the page is usable.
+    """
+    title = page_title.lower()
+    if status_code == 404 or "not found" in title or "log in" in title:
+        return UNAVAILABLE_ERROR_PREFIX
+    if status_code != 200 or "error" in title:
+        return FETCH_FAILED_ERROR_PREFIX
+    return None
+
+
+def error_result(arxiv_id: str, error: str) -> Dict[str, object]:
+    """Build the result dict for a paper whose check failed outright."""
+    return {
+        "arxiv_id": arxiv_id,
+        "endorsers": [],
+        "check_timestamp": datetime.now(_UTC).isoformat(timespec="seconds"),
+        "raw_html": "",
+        "error": error,
+    }
+
+
+def _cache_path(arxiv_id: str) -> Path:
+    """Cache file for a paper (old-style IDs like hep-th/9901001 contain a slash)."""
+    return ENDORSERS_CACHE_DIR / f"{arxiv_id.replace('/', '_')}.json"
+
+
+def get_cached_result(arxiv_id: str) -> Optional[Dict[str, object]]:
+    """Return the cached result for a paper, or None if missing or expired."""
+    path = _cache_path(arxiv_id)
+    try:
+        age = time.time() - path.stat().st_mtime
+        result = orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    
+    ttl = UNAVAILABLE_CACHE_TTL_SECONDS if result.get("error") else CACHE_TTL_SECONDS
+    return result if age < ttl else None
+
+
+def is_session_expired(result: Dict[str, object]) -> bool:
+    """Check if a result failed because arXiv served its login page."""
+    error = str(result.get("error") or "")
+    return error.startswith(UNAVAILABLE_ERROR_PREFIX) and "log in" in error.lower()
+
+
+def _cache_put(result: Dict[str, object]) -> None:
+    """Atomically store a result, unless it is a transient or session error.
+    
+    Only successful checks and missing papers are cached; throttling, server
+    errors and network errors are retried on the next run.
+    """
+    error = str(result.get("error") or "")
+    if error and (not error.startswith(UNAVAILABLE_ERROR_PREFIX) or is_session_expired(result)):
+        return
+    
+    ENDORSERS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=ENDORSERS_CACHE_DIR, suffix=".tmp", delete=False
+    ) as f:
+        f.write(dumps_json({**result, "raw_html": ""}))
+    os.replace(f.name, _cache_path(str(result["arxiv_id"])))
+
+
+def dumps_json(obj: object, pretty: bool = False) -> bytes:
+    """Serialize to compact (or indented, if pretty) JSON bytes."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+def create_http_client(state: Dict[str, object]) -> httpx.AsyncClient:
+    """Build an HTTP client carrying the cookies from a Playwright storage state dict."""
+    cookies = httpx.Cookies()
+    for cookie in state.get("cookies", []):
+        cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+    
+    return httpx.AsyncClient(cookies=cookies, http2=True, timeout=15, follow_redirects=True)
+
+
+def parse_endorsers_html(html: str) -> List[str]:
+    """Extract only the endorsers from the endorsers page HTML."""
+    endorsers = []
+    
+    # Rows containing "Can endorse for" list the author name in bold, followed by a colon
+    for row in HTMLParser(html).css('table tr'):
+        if 'can endorse' in row.text().lower():
+            for bold in row.css('b'):
+                author_name = bold.text().strip().rstrip(':')
+                if author_name and author_name not in endorsers:
+                    endorsers.append(author_name)
     
     return endorsers
 
 
+async def fetch_endorsers_http(
+    arxiv_id: str,
+    client: httpx.AsyncClient,
+    debug_html: bool = False,
+    limiter: Optional[RateLimiter] = None,
+) -> Optional[Dict[str, object]]:
+    """
+    Fetch the endorsers page over plain HTTP using the saved session cookies.
+    Throttled responses are retried with backoff and reported to `limiter`.
+    
+    Returns the same dict as check_paper_endorsements, or None if arXiv redirected
+    to the login page (session expired) so the caller can fall back to the browser.
+    """
+    check_timestamp = datetime.now(_UTC).isoformat(timespec="seconds")
+    print(f"  Checking {arxiv_id}...", file=sys.stderr)
+    
+    try:
+        response = await get_with_backoff(client, ENDORSERS_URL.format(arxiv_id=arxiv_id), limiter)
+    except httpx.HTTPError as e:
+        print(f"    Error checking paper: {e}", file=sys.stderr)
+        return {
+            "arxiv_id": arxiv_id,
+            "endorsers": [],
+            "check_timestamp": check_timestamp,
+            "raw_html": "",
+            "error": str(e),
+        }
+    
+    if "/login" in response.url.path:
+        print("    Session not accepted over HTTP, falling back to browser", file=sys.stderr)
+        return None
+    
+    # Check if we got a 404 or error page
+    title_node = HTMLParser(response.text).css_first('title')
+    page_title = title_node.text().strip() if title_node else ""
+    error_prefix = _unavailable_error_prefix(response.status_code, page_title)
+    if error_prefix:
+        reason = page_title or f"HTTP {response.status_code}"
+        print(f"    Endorsers page not available: {reason}", file=sys.stderr)
+        return {
+            "arxiv_id": arxiv_id,
+            "endorsers": [],
+            "check_timestamp": check_timestamp,
+            "raw_html": response.text if debug_html else "",
+            "error": f"{error_prefix}: {reason}",
+        }
+    
+    endorsers = parse_endorsers_html(response.text)
+    print(f"    Found {len(endorsers)} endorsers", file=sys.stderr)
+    
+    return {
+        "arxiv_id": arxiv_id,
+        "endorsers": endorsers,
+        "check_timestamp": check_timestamp,
+        "raw_html": response.text if debug_html else "",
+    }
+
+
+async def check_paper(
+    arxiv_id: str,
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    pages: RecyclingContext,
+    auth_manager: Optional[ArxivAuthManager] = None,
+    debug_html: bool = False,
+) -> Optional[Dict[str, object]]:
+    """
+    Check one paper over HTTP, falling back to a browser page if the session
+    cookies are rejected, and cache the result on disk.
+    
+    Args:
+        arxiv_id: arXiv paper ID
+        client: HTTP client carrying the session cookies
+        limiter: Rate limiter shared by all concurrent checks
+        pages: Authenticated browser pages, only used on fallback
+        auth_manager: If given, its saved state is cleared when the browser is also
+            sent to the login page, so the next run logs in again
+        debug_html: If True, keep the page HTML in the result's raw_html
+    """
+    await limiter.acquire()
+    result = await fetch_endorsers_http(arxiv_id, client, debug_html, limiter)
+    if result is None:
+        # Cookies were rejected over HTTP - retry in the authenticated browser
+        await limiter.acquire()
+        try:
+            page = await pages.new_page()
+            try:
+                result = await check_paper_endorsements(page, arxiv_id, debug_html)
+            finally:
+                await pages.release(page)
+        except Exception as e:
+            # A failed re-login while recycling or a crashed browser only fails this paper
+            print(f"    Error using browser page: {e}", file=sys.stderr)
+            result = error_result(arxiv_id, f"Browser fallback failed: {e}")
+    
+    if result:
+        if auth_manager and is_session_expired(result):
+            auth_manager.clear_auth_state()
+        _cache_put(result)
+    return result
+
+
 async def check_papers_batch(
     browser: Browser,
     paper_ids: List[str],
@@ -133,112 +503,284 @@ async def check_papers_batch(
     password: str,
     delay_seconds: int = DEFAULT_DELAY_SECONDS,
     result_callback=None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    force_refresh: bool = False,
+    verify_after_seconds: int = DEFAULT_VERIFY_AFTER_SECONDS,
+    debug_html: bool = False,
+    recycle_every: int = DEFAULT_RECYCLE_EVERY,
 ) -> List[Dict[str, object]]:
     """Check endorsements for a batch of papers with rate limiting.
     
+    Results cached on disk within their TTL are returned without any request, and
+    the browser is only authenticated if at least one paper needs fetching. The
+    remaining papers are checked concurrently by a pool of workers that fetch the
+    endorsers page over plain HTTP with the session cookies. A worker only opens a
+    page in the authenticated browser context if arXiv rejects those cookies; that
+    context is recycled every recycle_every pages. A single RateLimiter shared by
+    all workers caps the overall request rate at concurrency requests per
+    delay_seconds.
+    
     Args:
         browser: Playwright browser instance
         paper_ids: List of arXiv paper IDs to check
         username: arXiv username
         password: arXiv password
-        delay_seconds: Seconds to wait between papers
+        delay_seconds: Window in seconds for the rate limit (concurrency requests per window)
         result_callback: Optional callback function called after each paper with (result, idx, total)
+        concurrency: Number of papers checked in parallel
+        force_refresh: If True, ignore cached results and re-fetch every paper
+        verify_after_seconds: Only verify the saved session if it is older than this
+        debug_html: If True, keep each fetched page's HTML in raw_html
+        recycle_every: Recreate the browser context after this many pages
     """
-    results = []
+    total = len(paper_ids)
+    results: List[Optional[Dict[str, object]]] = [None] * total
+    completed = 0
+    
+    # Serve cached papers first; each free worker picks the next uncached paper
+    queue: asyncio.Queue = asyncio.Queue()
+    for position, paper_id in enumerate(paper_ids):
+        cached = None if force_refresh else get_cached_result(paper_id)
+        if cached is None:
+            queue.put_nowait((position, paper_id))
+            continue
+        
+        print(f"[{position + 1}/{total}] Using cached result for {paper_id}", file=sys.stderr)
+        results[position] = cached
+        completed += 1
+        if result_callback:
+            await result_callback(cached, completed, total)
+    
+    if queue.empty():
+        return [result for result in results if result is not None]
     
     # Use auth manager to get authenticated context
     auth_manager = ArxivAuthManager(username=username, password=password)
-    context = await auth_manager.create_authenticated_context(browser)
-    
+    context = await open_verified_context(auth_manager, browser, verify_after_seconds)
     if not context:
-        print("✗ Failed to authenticate - aborting", file=sys.stderr)
-        return []
+        print("  Aborting batch", file=sys.stderr)
+        return [result for result in results if result is not None]
     
-    # Verify authentication is still valid
-    is_valid = await auth_manager.verify_auth(context)
-    if not is_valid:
-        print("✗ Authentication expired, trying fresh login...", file=sys.stderr)
-        await context.close()
-        
-        # Retry with forced re-auth
-        context = await auth_manager.create_authenticated_context(browser, force_reauth=True)
-        if not context:
-            print("✗ Re-authentication failed - aborting", file=sys.stderr)
-            return []
-    
-    page = await context.new_page()
+    worker_count = max(1, min(concurrency, queue.qsize()))
+    limiter = RateLimiter(rate=worker_count, per=delay_seconds, jitter=DEFAULT_JITTER)
+    client = create_http_client(auth_manager.storage_state())
+    pages = RecyclingContext(auth_manager, browser, context, recycle_every)
     
-    # Process each paper
-    for idx, paper_id in enumerate(paper_ids, start=1):
-        print(f"\n[{idx}/{len(paper_ids)}] Processing {paper_id}", file=sys.stderr)
-        
-        result = await check_paper_endorsements(page, paper_id)
-        if result:
-            results.append(result)
+    async def worker() -> None:
+        nonlocal completed
+        while not queue.empty():
+            position, paper_id = queue.get_nowait()
+            print(f"\n[{position + 1}/{total}] Processing {paper_id}", file=sys.stderr)
             
-            # Call callback after each paper if provided
-            if result_callback:
-                await result_callback(result, idx, len(paper_ids))
-        
-        # Rate limiting - wait between papers (except for last one)
-        if idx < len(paper_ids):
-            print(f"  Waiting {delay_seconds} seconds before next paper...", file=sys.stderr)
-            await asyncio.sleep(delay_seconds)
+            result = await check_paper(
+                paper_id, client, limiter, pages, auth_manager, debug_html
+            )
+            if result:
+                results[position] = result
+                completed += 1
+                
+                # Call callback after each paper if provided
+                if result_callback:
+                    await result_callback(result, completed, total)
     
-    await context.close()
-    return results
+    try:
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+    finally:
+        await client.aclose()
+        await pages.close()
+    
+    return [result for result in results if result is not None]
 
 
-async def main_async(paper_ids: str, export_json: Optional[str]) -> int:
+async def check_papers_via_daemon(
+    paper_ids: List[str],
+    socket_path: Path = DEFAULT_DAEMON_SOCKET_PATH,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    force_refresh: bool = False,
+    result_callback=None,
+    debug_html: bool = False,
+) -> Optional[List[Dict[str, object]]]:
+    """Submit papers to a running arxiv_endorsement_daemon.py.
+    
+    Opens up to `concurrency` connections; each sends one newline-delimited JSON
+    request at a time and reads back the JSON result. The daemon applies its own
+    cache and rate limit. If the daemon goes away mid-batch, the papers it had
+    not answered yet are left out of the results for the caller to check locally.
+    
+    Returns:
+        Results in paper_ids order, or None if no daemon is listening on socket_path
+    """
+    total = len(paper_ids)
+    connections = []
+    try:
+        for _ in range(max(1, min(concurrency, total))):
+            connections.append(await asyncio.open_unix_connection(str(socket_path)))
+    except OSError:
+        for _, writer in connections:
+            writer.close()
+        return None
+    
+    print(f"✓ Using browser daemon at {socket_path}", file=sys.stderr)
+    
+    results: List[Optional[Dict[str, object]]] = [None] * total
+    completed = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for position, paper_id in enumerate(paper_ids):
+        queue.put_nowait((position, paper_id))
+    
+    async def worker(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal completed
+        try:
+            while not queue.empty():
+                position, paper_id = queue.get_nowait()
+                print(f"[{position + 1}/{total}] Submitting {paper_id}", file=sys.stderr)
+                
+                request = {
+                    "method": "check_paper",
+                    "arxiv_id": paper_id,
+                    "force_refresh": force_refresh,
+                    "debug_html": debug_html,
+                }
+                try:
+                    writer.write(dumps_json(request) + b"\n")
+                    await writer.drain()
+                    line = await reader.readline()
+                    if not line:
+                        raise ConnectionError("Browser daemon closed the connection")
+                    result = orjson.loads(line)
+                    if not isinstance(result, dict) or not result.get("arxiv_id"):
+                        raise ConnectionError(f"Unexpected reply from browser daemon: {line!r}")
+                except (OSError, ValueError) as e:
+                    # Leave this paper for another connection or the local fallback
+                    print(f"  Browser daemon connection lost: {e}", file=sys.stderr)
+                    queue.put_nowait((position, paper_id))
+                    return
+                
+                results[position] = result
+                completed += 1
+                if result_callback:
+                    await result_callback(result, completed, total)
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+    
+    await asyncio.gather(*(worker(reader, writer) for reader, writer in connections))
+    if not queue.empty():
+        print(f"  {queue.qsize()} papers were not checked by the daemon", file=sys.stderr)
+    return [result for result in results if result is not None]
+
+
+async def main_async(
+    paper_ids: str,
+    export_json: Optional[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    force_refresh: bool = False,
+    debug_html: bool = False,
+    pretty: bool = False,
+) -> int:
     """Async main function."""
     
-    # Parse paper IDs
-    papers = [pid.strip() for pid in paper_ids.split(',')]
+    # Parse paper IDs - dedupe and drop empties, preserving order
+    raw = (pid.strip() for pid in paper_ids.split(','))
+    papers = []
+    for pid in dict.fromkeys(pid for pid in raw if pid):
+        if ARXIV_ID_RE.fullmatch(pid):
+            papers.append(pid)
+        else:
+            print(f"Warning: Skipping invalid arXiv ID: {pid}", file=sys.stderr)
     
     if not papers:
         print("Error: No paper IDs provided", file=sys.stderr)
         return 1
     
-    # Get credentials from environment
-    username = os.getenv("ARXIV_USER") or os.getenv("ARXIV_USERNAME")
-    password = os.getenv("ARXIV_PASS") or os.getenv("ARXIV_PASSWORD")
+    # Stream compact results to the export file as they land, so progress survives
+    # a crash; pretty output is written in one go at the end
+    export_file = open(export_json, 'wb') if export_json and not pretty else None
+    exported = 0
     
-    if not username or not password:
-        print("Error: ARXIV_USER and ARXIV_PASS must be set in .env", file=sys.stderr)
-        return 1
+    async def export_result(result, idx, total):
+        nonlocal exported
+        export_file.write((b',' if exported else b'') + dumps_json(result))
+        export_file.flush()
+        exported += 1
     
-    # Launch browser
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+    result_callback = export_result if export_file else None
+    
+    try:
+        if export_file:
+            export_file.write(b'[')
         
-        try:
-            results = await check_papers_batch(browser, papers, username, password)
-            
-            # Print summary
-            print("\n" + "=" * 80, file=sys.stderr)
-            print("Summary", file=sys.stderr)
-            print("=" * 80, file=sys.stderr)
-            print(f"Papers checked: {len(results)}", file=sys.stderr)
-            
-            total_endorsers = sum(len(r.get("endorsers", [])) for r in results)
-            print(f"Total endorsers found: {total_endorsers}", file=sys.stderr)
+        # Hand the batch to a running daemon if there is one
+        results = None
+        if DEFAULT_DAEMON_SOCKET_PATH.exists():
+            results = await check_papers_via_daemon(
+                papers,
+                concurrency=concurrency,
+                force_refresh=force_refresh,
+                result_callback=result_callback,
+                debug_html=debug_html,
+            )
+        
+        # Anything the daemon didn't answer is checked in a local browser
+        results = results or []
+        checked = {result["arxiv_id"] for result in results}
+        remaining = [pid for pid in papers if pid not in checked]
+        
+        if remaining:
+            # Get credentials from environment
+            username, password = credentials()
             
-            # Show papers with endorsers
-            papers_with_endorsers = [r for r in results if r.get("endorsers")]
-            if papers_with_endorsers:
-                print(f"\nPapers with endorsers ({len(papers_with_endorsers)}):", file=sys.stderr)
-                for result in papers_with_endorsers:
-                    print(f"  {result['arxiv_id']}: {len(result['endorsers'])} endorsers", 
-                          file=sys.stderr)
+            if not username or not password:
+                print("Error: ARXIV_USER and ARXIV_PASS must be set in .env", file=sys.stderr)
+                return 1
             
-            # Export if requested
-            if export_json:
-                with open(export_json, 'w') as f:
-                    json.dump(results, f, indent=2)
-                print(f"\nExported results to {export_json}", file=sys.stderr)
-        
-        finally:
-            await browser.close()
+            # Launch browser
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+                
+                try:
+                    results += await check_papers_batch(
+                        browser,
+                        remaining,
+                        username,
+                        password,
+                        result_callback=result_callback,
+                        concurrency=concurrency,
+                        force_refresh=force_refresh,
+                        debug_html=debug_html,
+                    )
+                finally:
+                    await browser.close()
+    
+    finally:
+        if export_file:
+            export_file.write(b']')
+            export_file.close()
+    
+    # Print summary
+    print("\n" + "=" * 80, file=sys.stderr)
+    print("Summary", file=sys.stderr)
+    print("=" * 80, file=sys.stderr)
+    print(f"Papers checked: {len(results)}", file=sys.stderr)
+    
+    total_endorsers = sum(len(r.get("endorsers", [])) for r in results)
+    print(f"Total endorsers found: {total_endorsers}", file=sys.stderr)
+    
+    # Show papers with endorsers
+    papers_with_endorsers = [r for r in results if r.get("endorsers")]
+    if papers_with_endorsers:
+        print(f"\nPapers with endorsers ({len(papers_with_endorsers)}):", file=sys.stderr)
+        for result in papers_with_endorsers:
+            print(f"  {result['arxiv_id']}: {len(result['endorsers'])} endorsers", 
+                  file=sys.stderr)
+    
+    # Export if requested
+    if export_json:
+        if pretty:
+            with open(export_json, 'wb') as f:
+                f.write(dumps_json(results, pretty=True))
+        print(f"\nExported results to {export_json}", file=sys.stderr)
     
     return 0
 
@@ -257,9 +799,41 @@ def main() -> int:
         "--export-json",
         help="Export results to JSON file",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of papers checked in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Ignore cached endorser results and re-fetch every paper",
+    )
+    
+    parser.add_argument(
+        "--debug-html",
+        action="store_true",
+        help="Keep each endorsers page's HTML in the results (raw_html)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the exported JSON (default: compact)",
+    )
     
     args = parser.parse_args()
-    return asyncio.run(main_async(args.paper_ids, args.export_json))
+    return asyncio.run(
+        main_async(
+            args.paper_ids,
+            args.export_json,
+            args.concurrency,
+            args.force_refresh,
+            args.debug_html,
+            args.pretty,
+        )
+    )
 
 
 if __name__ == "__main__":
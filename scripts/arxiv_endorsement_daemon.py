@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Long-lived browser daemon for checking arXiv endorsement status.
+
+Keeps Chromium and the authenticated session warm between runs. While it is
+running, arxiv_endorsement_browser.py and run_endorser_search.py forward their
+endorsement checks here instead of launching their own browser.
+
+Protocol (Unix domain socket, newline-delimited JSON):
+    -> {"method": "check_paper", "arxiv_id": "2307.09288", "force_refresh": false, "debug_html": false}
+    <- {"arxiv_id": "2307.09288", "endorsers": [...], "check_timestamp": "...", ...}
+
+Requests without a "method" are treated as check_paper.
+
+Usage:
+    uv run python scripts/arxiv_endorsement_daemon.py
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from arxiv_auth_manager import ArxivAuthManager
+from arxiv_endorsement_browser import (
+    CHROMIUM_ARGS,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_DAEMON_SOCKET_PATH,
+    DEFAULT_DELAY_SECONDS,
+    DEFAULT_RECYCLE_EVERY,
+    RateLimiter,
+    RecyclingContext,
+    check_paper,
+    create_http_client,
+    dumps_json,
+    error_result,
+    get_cached_result,
+    is_session_expired,
+    open_verified_context,
+)
+from rate_limiter import DEFAULT_JITTER
+import orjson
+from playwright.async_api import async_playwright, Browser
+
+
+class EndorsementDaemon:
+    """Serves endorsement checks from one warm browser and authenticated session."""
+
+    def __init__(
+        self,
+        browser: Browser,
+        auth_manager: ArxivAuthManager,
+        delay_seconds: int = DEFAULT_DELAY_SECONDS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        recycle_every: int = DEFAULT_RECYCLE_EVERY,
+    ):
+        self.browser = browser
+        self.auth_manager = auth_manager
+        self.limiter = RateLimiter(rate=concurrency, per=delay_seconds, jitter=DEFAULT_JITTER)
+        self.recycle_every = recycle_every
+        self.pages: Optional[RecyclingContext] = None
+        self.client = None
+        # Clients replaced after a re-login; requests may still be using them
+        self._stale_clients = []
+        self._reauth_lock = asyncio.Lock()
+
+    async def start(self) -> bool:
+        """Authenticate and open the shared context and HTTP client."""
+        context = await open_verified_context(self.auth_manager, self.browser)
+        if not context:
+            return False
+
+        self.pages = RecyclingContext(self.auth_manager, self.browser, context, self.recycle_every)
+        self.client = create_http_client(self.auth_manager.storage_state())
+        return True
+
+    async def close(self) -> None:
+        for client in [*self._stale_clients, self.client]:
+            if client:
+                await client.aclose()
+        if self.pages:
+            await self.pages.close()
+
+    async def check(
+        self,
+        arxiv_id: str,
+        force_refresh: bool = False,
+        debug_html: bool = False,
+    ) -> Optional[Dict[str, object]]:
+        """Check one paper, using the disk cache unless force_refresh is set."""
+        cached = None if force_refresh else get_cached_result(arxiv_id)
+        if cached is not None:
+            print(f"  Using cached result for {arxiv_id}", file=sys.stderr)
+            return cached
+
+        client = self.client
+        result = await check_paper(
+            arxiv_id, client, self.limiter, self.pages, self.auth_manager, debug_html
+        )
+        if result and is_session_expired(result) and await self.reauthenticate(client):
+            result = await check_paper(
+                arxiv_id, self.client, self.limiter, self.pages, self.auth_manager, debug_html
+            )
+        return result
+
+    async def reauthenticate(self, stale_client) -> bool:
+        """
+        Log in again after the session expired, replacing the browser context and
+        rebuilding the HTTP client from the new cookies.
+
+        Concurrent requests that hit the same expiry share a single re-login.
+        Returns True if a fresh session is in place.
+        """
+        async with self._reauth_lock:
+            if self.client is not stale_client:
+                return True
+
+            print("✗ Session expired, logging in again...", file=sys.stderr)
+            try:
+                await self.pages.reauthenticate()
+            except Exception as e:
+                print(f"✗ Re-authentication failed: {e}", file=sys.stderr)
+                return False
+
+            self._stale_clients.append(self.client)
+            self.client = create_http_client(self.auth_manager.storage_state())
+            return True
+
+    async def dispatch(self, request: Dict[str, object]) -> Optional[Dict[str, object]]:
+        """Route one request to the handler named by its method."""
+        method = request.get("method", "check_paper")
+        if method == "check_paper":
+            return await self.check(
+                request["arxiv_id"],
+                bool(request.get("force_refresh", False)),
+                bool(request.get("debug_html", False)),
+            )
+        raise ValueError(f"Unknown method: {method}")
+
+    async def handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer newline-delimited JSON requests on one client connection."""
+        try:
+            while line := await reader.readline():
+                request: object = None
+                try:
+                    request = orjson.loads(line)
+                    result = await self.dispatch(request)
+                except Exception as e:
+                    print(f"  Error handling request {line!r}: {e}", file=sys.stderr)
+                    # Failures are still full results so clients can log them like any other
+                    arxiv_id = request.get("arxiv_id") if isinstance(request, dict) else None
+                    result = error_result(str(arxiv_id or ""), str(e))
+
+                writer.write(dumps_json(result) + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(
+    socket_path: Path,
+    delay_seconds: int,
+    concurrency: int,
+    recycle_every: int,
+) -> int:
+    """Run the daemon until interrupted."""
+    auth_manager = ArxivAuthManager()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        daemon = EndorsementDaemon(browser, auth_manager, delay_seconds, concurrency, recycle_every)
+        server: Optional[asyncio.AbstractServer] = None
+
+        try:
+            if not await daemon.start():
+                print("✗ Could not start the daemon", file=sys.stderr)
+                return 1
+
+            # A leftover socket from a crashed daemon would block binding
+            socket_path.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(daemon.handle_connection, path=str(socket_path))
+            print(f"✓ Endorsement daemon listening on {socket_path}", file=sys.stderr)
+
+            async with server:
+                await server.serve_forever()
+
+        finally:
+            if server is not None:
+                socket_path.unlink(missing_ok=True)
+            await daemon.close()
+            await browser.close()
+
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Keep a warm browser session for arXiv endorsement checks"
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_DAEMON_SOCKET_PATH,
+        help=f"Unix socket to listen on (default: {DEFAULT_DAEMON_SOCKET_PATH})",
+    )
+    parser.add_argument(
+        "--delay",
+        type=int,
+        default=DEFAULT_DELAY_SECONDS,
+        help=f"Rate limit window in seconds (default: {DEFAULT_DELAY_SECONDS})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Requests allowed per rate limit window (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--recycle-every",
+        type=int,
+        default=DEFAULT_RECYCLE_EVERY,
+        help=f"Recycle the browser context after N pages (default: {DEFAULT_RECYCLE_EVERY})",
+    )
+
+    args = parser.parse_args()
+    try:
+        return asyncio.run(serve(args.socket, args.delay, args.concurrency, args.recycle_every))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
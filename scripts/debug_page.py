@@ -1,65 +1,92 @@
 #!/usr/bin/env python3
 """Debug script to see what's actually on the arXiv paper page."""
+import argparse
 import asyncio
+import re
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from arxiv_auth_manager import ArxivAuthManager
 from playwright.async_api import async_playwright
 
-load_dotenv(Path(__file__).parent.parent / ".env")
+DEFAULT_ARXIV_ID = "1706.03762"
 
-async def debug_page():
+_ENDORS_RE = re.compile(r'endors', re.IGNORECASE)
+
+
+async def debug_page(arxiv_id: str = DEFAULT_ARXIV_ID, interactive: bool = False, wait: int = 30):
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
+        # Only show the browser window when someone is going to look at it
+        browser = await p.chromium.launch(headless=not interactive)
         
         auth_manager = ArxivAuthManager()
         context = await auth_manager.create_authenticated_context(browser)
         page = await context.new_page()
         
         # Navigate to a paper
-        arxiv_id = "1706.03762"
-        await page.goto(f"https://arxiv.org/abs/{arxiv_id}", wait_until="networkidle")
+        await page.goto(f"https://arxiv.org/abs/{arxiv_id}", wait_until="domcontentloaded")
         
         print(f"\n=== Checking page for {arxiv_id} ===\n")
         
-        # Check for endorsers link
-        endorsers_links = await page.query_selector_all('a')
+        # Check for endorsers link - read every link's href and text in one call
+        links = await page.eval_on_selector_all(
+            'a', 'els => els.map(e => ({href: e.getAttribute("href") || "", text: e.innerText}))'
+        )
+        
+        # Sort the links into both groups in a single pass
+        endorsers_links = []
+        author_links = []
+        for link in links:
+            href = link['href'].lower()
+            if 'endors' in href:
+                endorsers_links.append(link)
+            if 'author' in href:
+                author_links.append(link)
         
         print("All links on the page containing 'endors':")
         for link in endorsers_links:
-            href = await link.get_attribute('href')
-            text = await link.inner_text()
-            if href and 'endors' in href.lower():
-                print(f"  FOUND: {text} -> {href}")
+            print(f"  FOUND: {link['text']} -> {link['href']}")
         
         print("\nAll links containing 'author':")
-        for link in endorsers_links:
-            href = await link.get_attribute('href')
-            text = await link.inner_text()
-            if href and 'author' in href.lower():
-                print(f"  {text[:50]} -> {href[:80]}")
+        for link in author_links:
+            print(f"  {link['text'][:50]} -> {link['href'][:80]}")
         
-        # Check full page text for "endors"
+        # Check full page text for "endors" - scan the text once instead of
+        # lowercasing every line, and only slice out the lines that match
         page_text = await page.inner_text('body')
-        if 'endors' in page_text.lower():
+        matches = list(_ENDORS_RE.finditer(page_text))
+        if matches:
             print("\n'endors' found in page text")
-            lines = page_text.split('\n')
-            for i, line in enumerate(lines):
-                if 'endors' in line.lower():
-                    print(f"  Line {i}: {line.strip()}")
+            # Line numbers are counted incrementally between matches
+            i, counted_to, last_line = 0, 0, -1
+            for match in matches:
+                line_start = page_text.rfind('\n', 0, match.start()) + 1
+                i += page_text.count('\n', counted_to, line_start)
+                counted_to = line_start
+                if i == last_line:
+                    continue
+                last_line = i
+                line_end = page_text.find('\n', match.start())
+                line = page_text[line_start:line_end if line_end != -1 else len(page_text)]
+                print(f"  Line {i}: {line.strip()}")
         else:
             print("\n'endors' NOT found in page text")
         
-        print("\n\nPage will stay open for 30 seconds for manual inspection...")
-        await asyncio.sleep(30)
+        if interactive:
+            print(f"\n\nPage will stay open for {wait} seconds for manual inspection...")
+            await asyncio.sleep(wait)
         
         await context.close()
         await browser.close()
 
 if __name__ == "__main__":
-    asyncio.run(debug_page())
+    parser = argparse.ArgumentParser(description="Show what's on an arXiv paper page")
+    parser.add_argument("arxiv_id", nargs="?", default=DEFAULT_ARXIV_ID, help=f"arXiv paper ID (default: {DEFAULT_ARXIV_ID})")
+    parser.add_argument("--interactive", action="store_true", help="Open a visible browser and keep the page open for inspection")
+    parser.add_argument("--wait", type=int, default=30, help="Seconds to keep the page open with --interactive (default: 30)")
+    args = parser.parse_args()
+    
+    asyncio.run(debug_page(args.arxiv_id, args.interactive, args.wait))
 
@@ -3,92 +3,212 @@
 Fetch recent paper IDs from an arXiv category page.
 """
 import asyncio
+import contextlib
+import sqlite3
 import sys
 import re
 import time
 from datetime import datetime, timedelta
-from typing import List
-from playwright.async_api import async_playwright
+from pathlib import Path
+from typing import List, Optional, Set
 
-async def fetch_recent_papers(category: str = "cs.AI", limit: int = 20, skip_ids: List[str] = None) -> List[str]:
+import httpx
+import orjson
+from selectolax.parser import HTMLParser
+
+from rate_limiter import DEFAULT_JITTER, RateLimiter, get_with_backoff
+
+# arXiv lists have links like /abs/2307.09288
+_ABS_RE = re.compile(r'/abs/(\d+\.\d+)')
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Papers already checked and recently fetched listing pages, shared across runs
+CRAWL_CACHE_PATH = Path.home() / ".arxiv_reviewer_cache" / "crawl_cache.sqlite3"
+LISTING_TTL_SECONDS = 60 * 60
+# Checked papers are only skipped for a week, matching how often endorser lists change
+SEEN_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Listing pages are fetched in waves of LISTING_CONCURRENCY, one wave per
+# LISTING_WAVE_SECONDS; the pace adapts if arXiv throttles
+LISTING_CONCURRENCY = 2
+LISTING_WAVE_SECONDS = 5
+
+
+def open_crawl_cache() -> sqlite3.Connection:
+    """Open the crawl cache database, creating its tables if needed.
+    
+    The caller closes the connection; open it once and pass it to load_seen_ids
+    and mark_seen rather than reopening it per paper.
+    """
+    CRAWL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CRAWL_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS seen_papers (arxiv_id TEXT PRIMARY KEY, checked_at REAL NOT NULL)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS listing_pages "
+        "(url TEXT PRIMARY KEY, fetched_at REAL NOT NULL, hrefs TEXT NOT NULL)"
+    )
+    return conn
+
+
+def load_seen_ids(conn: sqlite3.Connection) -> Set[str]:
+    """Return the IDs of papers checked by a previous run within SEEN_TTL_SECONDS."""
+    rows = conn.execute(
+        "SELECT arxiv_id FROM seen_papers WHERE checked_at > ?",
+        (time.time() - SEEN_TTL_SECONDS,),
+    )
+    return {row[0] for row in rows}
+
+
+def mark_seen(conn: sqlite3.Connection, arxiv_id: str) -> None:
+    """Record a successfully checked paper so future fetches skip it."""
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO seen_papers (arxiv_id, checked_at) VALUES (?, ?)",
+            (arxiv_id, time.time()),
+        )
+
+
+def _get_cached_listing(conn: sqlite3.Connection, url: str) -> Optional[List[str]]:
+    """Return the hrefs of a listing page fetched within LISTING_TTL_SECONDS."""
+    row = conn.execute(
+        "SELECT hrefs FROM listing_pages WHERE url = ? AND fetched_at > ?",
+        (url, time.time() - LISTING_TTL_SECONDS),
+    ).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def _put_cached_listing(conn: sqlite3.Connection, url: str, hrefs: List[str]) -> None:
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO listing_pages (url, fetched_at, hrefs) VALUES (?, ?, ?)",
+            (url, time.time(), orjson.dumps(hrefs).decode()),
+        )
+
+
+async def _fetch_listing(
+    client: httpx.AsyncClient,
+    crawl_cache: sqlite3.Connection,
+    url: str,
+    limiter: RateLimiter,
+    semaphore: asyncio.Semaphore,
+) -> List[str]:
+    """Return the /abs/ hrefs on one listing page, from the crawl cache if fresh."""
+    hrefs = _get_cached_listing(crawl_cache, url)
+    if hrefs is not None:
+        print(f"Using cached listing for {url}", file=sys.stderr)
+        return hrefs
+    
+    async with semaphore:
+        await limiter.acquire()
+        print(f"Fetching from {url}...", file=sys.stderr)
+        response = await get_with_backoff(client, url, limiter)
+        response.raise_for_status()
+    
+    hrefs = [
+        node.attributes.get("href") or ""
+        for node in HTMLParser(response.text).css('a[href^="/abs/"]')
+    ]
+    _put_cached_listing(crawl_cache, url, hrefs)
+    return hrefs
+
+
+async def fetch_recent_papers(
+    category: str = "cs.AI",
+    limit: int = 20,
+    skip_ids: List[str] = None,
+    skip_seen: bool = False,
+) -> List[str]:
     """
     Fetch recent paper IDs from arXiv category page with pagination support.
     Uses show parameter to get more papers per request (skip=X&show=Y).
+    The listing is server-rendered, so plain HTTP is enough - no browser needed.
+    Pages are fetched LISTING_CONCURRENCY at a time and processed in order.
     
     Args:
         category: arXiv category (e.g., "cs.AI")
         limit: Number of NEW papers to fetch (not counting skip_ids)
         skip_ids: List of paper IDs to skip (e.g., already cached papers)
+        skip_seen: Also skip papers recorded with mark_seen within SEEN_TTL_SECONDS
     """
     paper_ids = []
+    paper_ids_set = set()  # Mirrors paper_ids for O(1) membership checks
     skip_ids = skip_ids or []
     skip_ids_set = set(skip_ids)  # For faster lookups
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
-        
+    # Start skip at number of papers we're skipping to avoid fetching them at all
+    skip = len(skip_ids_set)
+    
+    # Both are closed on every exit, including cancellation and Ctrl-C mid-crawl
+    async with httpx.AsyncClient(
+        http2=True, headers={"User-Agent": USER_AGENT}, timeout=15, follow_redirects=True
+    ) as client, contextlib.closing(open_crawl_cache()) as crawl_cache:
+        if skip_seen:
+            skip_ids_set |= load_seen_ids(crawl_cache)
+            
         # arXiv recent page supports pagination with ?skip=X&show=Y
         # Valid show values: 25, 50, 100, 250
         # Using 50 to be very respectful of arXiv's servers
-        # Start skip at number of papers we're skipping to avoid fetching them at all
-        skip = len(skip_ids_set)
         show_per_page = 50
-        page_num = 0
+        # Each wave's pages are acquired together, so the bucket lets one wave through
+        # per LISTING_WAVE_SECONDS (the first is immediate)
+        limiter = RateLimiter(rate=LISTING_CONCURRENCY, per=LISTING_WAVE_SECONDS, jitter=DEFAULT_JITTER)
+        semaphore = asyncio.Semaphore(LISTING_CONCURRENCY)
         
         if skip > 0:
             print(f"  Starting fetch at skip={skip} (skipping {skip} cached papers)", file=sys.stderr)
         
-        while len(paper_ids) < limit:
-            # Rate limiting: 10 second delay before each request (except first)
-            if page_num > 0:
-                print(f"  Waiting 10 seconds before next page...", file=sys.stderr)
-                await asyncio.sleep(10)
-            
-            url = f"https://arxiv.org/list/{category}/recent?skip={skip}&show={show_per_page}"
-            print(f"Fetching from {url}...", file=sys.stderr)
+        exhausted = False
+        while len(paper_ids) < limit and not exhausted:
+            # Only fetch as many pages as the remaining limit could need
+            pages_needed = -(-(limit - len(paper_ids)) // show_per_page)
+            urls = [
+                f"https://arxiv.org/list/{category}/recent?skip={skip + i * show_per_page}&show={show_per_page}"
+                for i in range(min(LISTING_CONCURRENCY, pages_needed))
+            ]
+            pages = await asyncio.gather(
+                *(_fetch_listing(client, crawl_cache, url, limiter, semaphore) for url in urls),
+                return_exceptions=True,
+            )
             
-            try:
-                await page.goto(url, wait_until="networkidle", timeout=30000)
+            for url, hrefs in zip(urls, pages):
+                if isinstance(hrefs, Exception):
+                    print(f"  Warning: Could not fetch from {url}: {hrefs}", file=sys.stderr)
+                    exhausted = True
+                    break
                 
-                # arXiv lists have links like /abs/2307.09288
-                links = await page.query_selector_all('a[href^="/abs/"]')
+                papers_on_page = 0
+                # Each paper is linked several times; dedupe hrefs (keeping listing order) before matching
+                for href in dict.fromkeys(hrefs):
+                    match = _ABS_RE.search(href)
+                    if match:
+                        papers_on_page += 1
+                        pid = match.group(1)
+                        # Skip if already in our list or in the skip list
+                        if pid not in paper_ids_set and pid not in skip_ids_set:
+                            paper_ids.append(pid)
+                            paper_ids_set.add(pid)
+                            if len(paper_ids) >= limit:
+                                break
                 
-                papers_found_this_page = 0
-                for link in links:
-                    href = await link.get_attribute('href')
-                    if href:
-                        match = re.search(r'/abs/(\d+\.\d+)', href)
-                        if match:
-                            pid = match.group(1)
-                            # Skip if already in our list or in the skip list
-                            if pid not in paper_ids and pid not in skip_ids_set:
-                                paper_ids.append(pid)
-                                papers_found_this_page += 1
-                                if len(paper_ids) >= limit:
-                                    break
+                if len(paper_ids) >= limit:
+                    break
                 
-                # If we didn't find any new papers on this page, we've exhausted the listing
-                if papers_found_this_page == 0:
-                    print(f"  No more new papers found, stopping at {len(paper_ids)} papers", file=sys.stderr)
+                # A page with no paper links at all is past the end of the listing; a page
+                # whose papers were all skipped just means the new ones are further on
+                if papers_on_page == 0:
+                    print(f"  No more papers listed, stopping at {len(paper_ids)} papers", file=sys.stderr)
+                    exhausted = True
                     break
                 
                 skip += show_per_page
-                page_num += 1
-                    
-            except Exception as e:
-                print(f"  Warning: Could not fetch from {url}: {e}", file=sys.stderr)
-                page_num += 1
-                break
-        
-        await browser.close()
     
     print(f"✓ Fetched {len(paper_ids)} unique papers", file=sys.stderr)
     return paper_ids
 
+
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Fetch recent arXiv paper IDs")
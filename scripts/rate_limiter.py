@@ -0,0 +1,114 @@
+"""
+Adaptive rate limiting and 429/503 backoff for requests to arXiv.
+
+Kept free of Playwright so plain-HTTP scripts can use it without a browser.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import time
+from collections import deque
+from typing import Optional
+
+import httpx
+
+
+DEFAULT_JITTER = 0.2
+
+# arXiv pushes back with these; back off exponentially and slow the limiter down
+THROTTLE_STATUS_CODES = {429, 503}
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+# Clean responses in a row before the limiter speeds back up
+ADAPT_WINDOW = 20
+
+
+class RateLimiter:
+    """Token bucket allowing at most `rate` requests per `per` seconds.
+    
+    Unused allowance accumulates (up to `rate`), so requests that are already
+    slow don't pay an additional fixed delay on top of their own latency. Waits
+    are stretched by up to `jitter` (a fraction) so requests don't land in lockstep.
+    
+    The window adapts to the responses passed to record(): it doubles (up to 8x
+    the initial `per`) whenever arXiv throttles, and halves (down to half the
+    initial `per`) after ADAPT_WINDOW clean responses in a row.
+    """
+    
+    def __init__(self, rate: float, per: float, jitter: float = 0.0):
+        self.rate = rate
+        self.per = per
+        self.min_per = per / 2
+        self.max_per = per * 8
+        self.jitter = jitter
+        self.allowance = rate
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._recent = deque(maxlen=ADAPT_WINDOW)
+    
+    def record(self, status_code: int) -> None:
+        """Adjust the window to the status code of a completed request."""
+        if status_code in THROTTLE_STATUS_CODES:
+            self._recent.clear()
+            if self.per < self.max_per:
+                self.per = min(self.max_per, self.per * 2)
+                print(f"  Throttled by arXiv, slowing down to {self.rate:g} requests per {self.per:.1f}s", file=sys.stderr)
+            return
+        
+        self._recent.append(status_code)
+        if len(self._recent) == ADAPT_WINDOW and self.per > self.min_per:
+            self._recent.clear()
+            self.per = max(self.min_per, self.per / 2)
+            print(f"  No throttling lately, speeding up to {self.rate:g} requests per {self.per:.1f}s", file=sys.stderr)
+    
+    async def acquire(self) -> None:
+        """Wait until a request token is available and consume it."""
+        if self.per <= 0:
+            return
+        
+        async with self._lock:
+            now = time.monotonic()
+            self.allowance = min(
+                self.rate, self.allowance + (now - self.last) * self.rate / self.per
+            )
+            self.last = now
+            
+            if self.allowance < 1:
+                wait = (1 - self.allowance) * self.per / self.rate
+                wait *= random.uniform(1, 1 + self.jitter)
+                print(f"  Rate limit reached, waiting {wait:.1f} seconds...", file=sys.stderr)
+                await asyncio.sleep(wait)
+                self.last = time.monotonic()
+                self.allowance = 0
+            else:
+                self.allowance -= 1
+
+
+async def get_with_backoff(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: Optional[RateLimiter] = None,
+) -> httpx.Response:
+    """
+    GET a URL, retrying with exponential backoff while arXiv answers 429/503.
+    
+    Every response status is reported to the limiter (if given) so it can adapt,
+    and each retry also waits for a limiter token, so retries go through the
+    same (now slower) bucket as every other request. The caller acquires the
+    token for the first attempt. Returns the last response, which is still a
+    429/503 if all retries failed.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.get(url)
+        if limiter:
+            limiter.record(response.status_code)
+        if response.status_code not in THROTTLE_STATUS_CODES or attempt == MAX_RETRIES:
+            return response
+        
+        wait = min(MAX_BACKOFF_SECONDS, 2 ** attempt) + random.uniform(0, 1)
+        print(f"    HTTP {response.status_code}, retrying in {wait:.1f} seconds...", file=sys.stderr)
+        await asyncio.sleep(wait)
+        if limiter:
+            await limiter.acquire()
@@ -7,36 +7,169 @@ End-to-end automation to find arXiv endorsers.
 """
 import asyncio
 import argparse
+import contextlib
 import sys
-import os
-import json
 from pathlib import Path
-from dotenv import load_dotenv
-from playwright.async_api import async_playwright
+import orjson
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fetch_papers import fetch_recent_papers
-from arxiv_endorsement_browser import check_papers_batch
-from arxiv_auth_manager import ArxivAuthManager
+from _config import credentials
+
+# Playwright and the scraping modules are imported where they are used, so
+# --help and argument errors don't pay their import cost
+
+
+def load_results(log_path, output_path):
+    """Load previously checked results, keeping the latest entry per paper.
+    
+    Reads the JSONL log; if there is none yet, seeds it from an aggregate JSON
+    report written by an older run. Lines that don't parse or lack an arxiv_id
+    (e.g. a write cut short by a crash) are skipped.
+    """
+    if not log_path.exists() and output_path.exists():
+        legacy_results = orjson.loads(output_path.read_bytes()).get('results', [])
+        with open(log_path, 'wb') as f:
+            for result in legacy_results:
+                f.write(orjson.dumps(result) + b"\n")
+    
+    results = {}
+    skipped = 0
+    if log_path.exists():
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    result = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    skipped += 1
+                    continue
+                if not isinstance(result, dict) or not result.get('arxiv_id'):
+                    skipped += 1
+                    continue
+                results[result['arxiv_id']] = result
+    if skipped:
+        print(f"   ⚠️  Skipped {skipped} unreadable line(s) in {log_path}")
+    return list(results.values())
+
+
+def write_report(output_path, category, results):
+    """Write the aggregate JSON report in one go."""
+    check_data = {
+        "category": category,
+        "papers_scanned": len(results),
+        "results": results
+    }
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(check_data, option=orjson.OPT_INDENT_2))
+
+
+def print_report(new_results, existing_results, output):
+    """Print a summary of the papers checked in this run."""
+    print("\n📊 SEARCH RESULTS")
+    print("=" * 60)
+
+    found_count = 0
+    all_endorsers = set()
+
+    for res in new_results:
+        eid = res.get('arxiv_id')
+        endorsers = res.get('endorsers', [])
+        if endorsers:
+            found_count += 1
+            print(f"\n📄 Paper: {eid}")
+            print(f"   Link: https://arxiv.org/abs/{eid}")
+            print(f"   ✅ Eligible Endorsers found: {len(endorsers)}")
+            for name in endorsers:
+                print(f"      - {name}")
+                all_endorsers.add(name)
+        elif res.get('error'):
+            print(f"\n📄 Paper: {eid} - ⚠️ {res.get('error')}")
+        else:
+            pass # Silent for no endorsers to keep output clean? Or log it.
+
+    print("\n" + "-" * 60)
+    print(f"Summary:")
+    print(f"  Papers Checked (this run): {len(new_results)}")
+    print(f"  Total Papers in Cache: {len(existing_results) + len(new_results)}")
+    print(f"  Papers with Endorsers (this run): {found_count}")
+    print(f"  Unique Endorsers Found (this run): {len(all_endorsers)}")
+
+    print(f"\n✅ All results saved to {output}")
+
+
+async def search_papers(args, username, password, already_checked, result_callback):
+    """Fetch new papers and check them, via the browser daemon when it is running."""
+    from playwright.async_api import async_playwright
+    from fetch_papers import fetch_recent_papers
+    from arxiv_endorsement_browser import CHROMIUM_ARGS, check_papers_batch, check_papers_via_daemon
+    
+    # 3. Fetch Recent Papers (skipping already-cached ones)
+    print(f"\n📡 Fetching {args.limit} NEW papers from {args.category} (skipping {len(already_checked)} cached)...")
+    try:
+        paper_ids = await fetch_recent_papers(
+            args.category, args.limit, skip_ids=list(already_checked), skip_seen=True
+        )
+        print(f"✓ Found {len(paper_ids)} NEW papers: {', '.join(paper_ids)}")
+    except Exception as e:
+        print(f"✗ Error fetching papers: {e}")
+        return 1
+
+    if not paper_ids:
+        print("No new papers to process.")
+        return 0
+    
+    # A running arxiv_endorsement_daemon.py already has a warm browser and session
+    results = await check_papers_via_daemon(
+        paper_ids, concurrency=args.concurrency, result_callback=result_callback
+    )
+    # Papers the daemon didn't get to (e.g. it exited mid-batch) are checked locally
+    checked = {result['arxiv_id'] for result in results or []}
+    paper_ids = [pid for pid in paper_ids if pid not in checked]
+    if not paper_ids:
+        return 0
+    
+    async with async_playwright() as p:
+        # Launch the browser only for the authenticated endorser checks
+        # (headless unless --visible is set for debugging)
+        browser = await p.chromium.launch(headless=not args.visible, args=CHROMIUM_ARGS)
+        
+        try:
+            # 5. Check for Endorsers
+            print(f"\n🔍 Checking {len(paper_ids)} papers for endorsers (Browser visible: {args.visible})...")
+            
+            await check_papers_batch(
+                browser,
+                paper_ids,
+                username,
+                password,
+                args.delay,
+                result_callback,
+                concurrency=args.concurrency,
+            )
+        finally:
+            await browser.close()
+
+    return 0
 
-# Load .env
-load_dotenv(Path(__file__).parent.parent / ".env")
 
 async def main():
     parser = argparse.ArgumentParser(description="Find eligible arXiv endorsers from recent papers")
     parser.add_argument("--category", default="cs.AI", help="arXiv category to scan (default: cs.AI)")
     parser.add_argument("--limit", type=int, default=10, help="Number of recent papers to check")
-    parser.add_argument("--headless", action="store_true", help="Run in headless mode (default: False for visibility)")
+    parser.add_argument("--visible", action="store_true", help="Show the browser window (default: headless)")
     parser.add_argument("--output", default="endorsers_report.json", help="Output JSON file")
-    parser.add_argument("--delay", type=int, default=30, help="Delay in seconds between paper checks (default: 30)")
+    parser.add_argument("--delay", type=int, default=30, help="Initial delay in seconds between paper checks; adapts to throttling (default: 30)")
+    parser.add_argument("--concurrency", type=int, default=3, help="Number of papers checked in parallel (default: 3)")
     
     args = parser.parse_args()
     
+    from fetch_papers import mark_seen, open_crawl_cache
+    
     # 1. Check Credentials
-    username = os.getenv("ARXIV_USER") or os.getenv("ARXIV_USERNAME")
-    password = os.getenv("ARXIV_PASS") or os.getenv("ARXIV_PASSWORD")
+    username, password = credentials()
     
     if not username or not password:
         print("Error: ARXIV_USER and ARXIV_PASS must be set in .env", file=sys.stderr)
@@ -46,100 +179,54 @@ async def main():
     print("-" * 60)
 
     # 2. Load existing results to know which papers to skip
+    # Every result is appended to a JSONL log next to the output file; the
+    # aggregate JSON is only rebuilt from it once, at the end of the run
+    log_path = Path(args.output).with_suffix(".jsonl")
     existing_results = []
-    already_checked = set()
+    load_failed = False
     
-    if Path(args.output).exists():
-        try:
-            with open(args.output, 'r') as f:
-                existing_data = json.load(f)
-                existing_results = existing_data.get('results', [])
-                already_checked = {r['arxiv_id'] for r in existing_results}
-            
-            if already_checked:
-                print(f"\n💾 Found {len(already_checked)} already-checked papers in cache")
-        except Exception as e:
-            print(f"   ⚠️  Could not load existing cache: {e}")
-    
-    # 3. Fetch Recent Papers (skipping already-cached ones)
-    print(f"\n📡 Fetching {args.limit} NEW papers from {args.category} (skipping {len(already_checked)} cached)...")
     try:
-        paper_ids = await fetch_recent_papers(args.category, args.limit, skip_ids=list(already_checked))
-        print(f"✓ Found {len(paper_ids)} NEW papers: {', '.join(paper_ids)}")
+        existing_results = load_results(log_path, Path(args.output))
     except Exception as e:
-        print(f"✗ Error fetching papers: {e}")
-        return 1
-
-    if not paper_ids:
-        print("No new papers to process.")
-        return 0
-
-    # 5. Check for Endorsers
-    print(f"\n🔍 Checking {len(paper_ids)} papers for endorsers (Browser visible: {not args.headless})...")
+        print(f"   ⚠️  Could not load existing cache: {e}")
+        load_failed = True
     
-    # Create callback to save results incrementally
-    new_results = []
+    already_checked = {r['arxiv_id'] for r in existing_results}
+    if already_checked:
+        print(f"\n💾 Found {len(already_checked)} already-checked papers in cache")
     
-    async def save_result_callback(result, idx, total):
-        """Save results after each paper is checked."""
-        new_results.append(result)
-        
-        # Merge with existing results and save
-        all_results = existing_results + new_results
-        check_data = {
-            "category": args.category,
-            "papers_scanned": len(all_results),
-            "results": all_results
-        }
-        
-        with open(args.output, 'w') as f:
-            json.dump(check_data, f, indent=2)
-        
-        print(f"  💾 Saved progress: {len(all_results)} total papers in cache", file=sys.stderr)
+    new_results = []
     
-    async with async_playwright() as p:
-        # Launch browser (headless=False by default to satisfy 'REAL browsing' request unless flag set)
-        browser = await p.chromium.launch(headless=args.headless)
-        
-        try:
-            results = await check_papers_batch(browser, paper_ids, username, password, args.delay, save_result_callback)
-            
-            # 6. Report Results
-            print("\n📊 SEARCH RESULTS")
-            print("=" * 60)
-            
-            found_count = 0
-            all_endorsers = set()
+    # One crawl cache connection records every paper checked in this run
+    with open(log_path, 'ab') as log_file, contextlib.closing(open_crawl_cache()) as crawl_cache:
+        async def save_result_callback(result, idx, total):
+            """Append each result to the JSONL log as soon as it is checked."""
+            new_results.append(result)
+            if not result.get('error'):
+                mark_seen(crawl_cache, result['arxiv_id'])
             
-            for res in new_results:
-                eid = res.get('arxiv_id')
-                endorsers = res.get('endorsers', [])
-                if endorsers:
-                    found_count += 1
-                    print(f"\n📄 Paper: {eid}")
-                    print(f"   Link: https://arxiv.org/abs/{eid}")
-                    print(f"   ✅ Eligible Endorsers found: {len(endorsers)}")
-                    for name in endorsers:
-                        print(f"      - {name}")
-                        all_endorsers.add(name)
-                elif res.get('error'):
-                    print(f"\n📄 Paper: {eid} - ⚠️ {res.get('error')}")
-                else:
-                    pass # Silent for no endorsers to keep output clean? Or log it.
-            
-            print("\n" + "-" * 60)
-            print(f"Summary:")
-            print(f"  Papers Checked (this run): {len(new_results)}")
-            print(f"  Total Papers in Cache: {len(existing_results) + len(new_results)}")
-            print(f"  Papers with Endorsers (this run): {found_count}")
-            print(f"  Unique Endorsers Found (this run): {len(all_endorsers)}")
-            
-            print(f"\n✅ All results saved incrementally to {args.output}")
+            log_file.write(orjson.dumps(result) + b"\n")
+            log_file.flush()
             
+            print(f"  💾 Saved progress: {len(existing_results) + len(new_results)} total papers in cache", file=sys.stderr)
+        
+        try:
+            status = await search_papers(
+                args, username, password, already_checked, save_result_callback
+            )
         finally:
-            await browser.close()
-
-    return 0
+            # Without the earlier results the report would only cover this run, so
+            # leave it alone; everything checked is still in the JSONL log
+            if new_results and load_failed:
+                print(f"   ⚠️  Not rewriting {args.output}; this run's results are in {log_path}")
+            elif new_results:
+                write_report(Path(args.output), args.category, existing_results + new_results)
+    
+    # 6. Report Results
+    if new_results:
+        print_report(new_results, existing_results, args.output)
+    
+    return status
 
 if __name__ == "__main__":
     sys.exit(asyncio.run(main()))
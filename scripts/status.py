@@ -9,16 +9,12 @@ Shows:
 """
 from __future__ import annotations
 
+import importlib.util
 import os
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-# Load .env
-env_path = Path.cwd() / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+from _config import credentials
 
 def check_status():
     """Check and display system status."""
@@ -31,8 +27,7 @@ def check_status():
     # Check credentials
     print("📋 CREDENTIALS")
     print("-" * 80)
-    arxiv_user = os.getenv("ARXIV_USER") or os.getenv("ARXIV_USERNAME")
-    arxiv_pass = os.getenv("ARXIV_PASS") or os.getenv("ARXIV_PASSWORD")
+    arxiv_user, arxiv_pass = credentials()
     
     if arxiv_user and arxiv_pass:
         print(f"  ✓ Username: {arxiv_user}")
@@ -48,8 +43,9 @@ def check_status():
     auth_state_path = Path.home() / ".arxiv_reviewer_cache" / "arxiv_auth_state.json"
     
     if auth_state_path.exists():
-        size = auth_state_path.stat().st_size
-        mtime = auth_state_path.stat().st_mtime
+        stat = auth_state_path.stat()
+        size = stat.st_size
+        mtime = stat.st_mtime
         from datetime import datetime
         mod_time = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
         
@@ -72,13 +68,13 @@ def check_status():
     if cache_dir.exists():
         print(f"  ✓ Cache directory: {cache_dir}")
         
-        # List contents
-        files = list(cache_dir.iterdir())
-        if files:
-            print(f"  ✓ Files: {len(files)}")
-            for f in files:
-                size_kb = f.stat().st_size / 1024
-                print(f"    - {f.name} ({size_kb:.1f} KB)")
+        # List contents - scandir entries carry their stat info from the directory read
+        with os.scandir(cache_dir) as it:
+            entries = [(e.name, e.stat().st_size) for e in it]
+        if entries:
+            print(f"  ✓ Files: {len(entries)}")
+            for name, size in entries:
+                print(f"    - {name} ({size / 1024:.1f} KB)")
         else:
             print("  ℹ Empty cache directory")
     else:
@@ -90,24 +86,22 @@ def check_status():
     print("📦 DEPENDENCIES")
     print("-" * 80)
     
-    try:
-        import playwright
-        print(f"  ✓ playwright: installed")
-    except ImportError:
-        print("  ✗ playwright not installed")
-        print("    Run: uv sync && uv run playwright install chromium")
-    
-    try:
-        import requests
-        print(f"  ✓ requests: installed")
-    except ImportError:
-        print("  ✗ requests not installed")
-    
-    try:
-        import dotenv
-        print(f"  ✓ python-dotenv: installed")
-    except ImportError:
-        print("  ✗ python-dotenv not installed")
+    # find_spec only locates the packages, without paying their import cost
+    dependencies = [
+        ("playwright", "playwright"),
+        ("httpx", "httpx"),
+        ("selectolax", "selectolax"),
+        ("orjson", "orjson"),
+        ("requests", "requests"),
+        ("dotenv", "python-dotenv"),
+    ]
+    for module, label in dependencies:
+        if importlib.util.find_spec(module):
+            print(f"  ✓ {label}: installed")
+        else:
+            print(f"  ✗ {label} not installed")
+            if module == "playwright":
+                print("    Run: uv sync && uv run playwright install chromium")
     
     print()
     